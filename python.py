@@ -1,8 +1,15 @@
 from __future__ import annotations
 
+import re
+import string
 import sys
+from dataclasses import dataclass
+from itertools import groupby
+from operator import attrgetter
 from typing import assert_never
+from typing import Callable
 from typing import Final
+from typing import get_args
 from typing import Literal
 from typing import NoReturn
 from typing import TypeAlias
@@ -38,6 +45,7 @@ TokenKind = Literal[
     '!=',
     '->',
     '|',
+    '@',
     ':',
     ':=',
     "'",
@@ -55,7 +63,7 @@ TokenKind = Literal[
     'instance_indent',
 ]
 
-KEYWORDS: Final = [
+KEYWORDS: Final = frozenset({
     'if',
     'else',
     'elif',
@@ -91,12 +99,62 @@ KEYWORDS: Final = [
     'Exception',
     'SyntaxError',
     '__name__',
-]
-
-EOF: Final = 'EOF'
+})
+
+ONE_CHAR_TOKENS: Final[dict[str, TokenKind]] = {
+    '(': '(',
+    ')': ')',
+    '[': '[',
+    ']': ']',
+    '{': '{',
+    '}': '}',
+    '=': '=',
+    '>': '>',
+    '<': '<',
+    '/': '/',
+    '+': '+',
+    '-': '-',
+    '*': '*',
+    '%': '%',
+    '|': '|',
+    '@': '@',
+    ':': ':',
+    '.': '.',
+    ',': ',',
+}
+
+TWO_CHAR_TOKENS: Final[dict[str, TokenKind]] = {
+    '==': '==',
+    '//': '//',
+    '**': '**',
+    '>=': '>=',
+    '<=': '<=',
+    '+=': '+=',
+    '-=': '-=',
+    '/=': '/=',
+    '*=': '*=',
+    '%=': '%=',
+    '!=': '!=',
+    '->': '->',
+    ':=': ':=',
+}
+
+ASCII_NAME_CHARS: Final = string.ascii_letters + string.digits + '_'
+
+# NOTE: `\w` matches what `isalpha() or isnumeric() or == '_'` accepts, unicode included.
+NAME_RE: Final = re.compile(r'\w+')
+SPACES_RE: Final = re.compile(r' +')
+INDENT_RE: Final = re.compile(r' *')
+
+KIND_REPRS: Final[dict[str, str]] = {
+    kind: kind.removeprefix('instance_') for kind in get_args(TokenKind)
+}
+KIND_REPRS['instance_indent'] = 'indent'
 
 
 class Token:
+    __slots__ = ('line', 'col', 'kind', 'instance')
+
     def __init__(
         self,
         line: int,
@@ -110,14 +168,10 @@ class Token:
         self.instance = instance
 
     def __repr__(self) -> str:
+        kind_repr = KIND_REPRS[self.kind]
         if self.instance is None:
-            if self.kind == 'instance_indent':
-                return 'indent'
-            else:
-                return self.kind
-        else:
-            instance_kind = self.kind.removeprefix('instance_')
-            return f'{instance_kind}({self.instance})'
+            return kind_repr
+        return f'{kind_repr}({self.instance})'
 
 
 class Lexer:
@@ -125,48 +179,33 @@ class Lexer:
         self.src = src
         self.pos = 0
         self.line = 1
-        self.col = 1
-        self.line_start = self.line
-        self.col_start = self.col
-        self.char: str = self.src[self.pos] if self.src else EOF
+        # NOTE: Only line starts are tracked; a col is worked out from pos when needed.
+        self.line_pos = 0
         self.tokens: list[Token] = []
 
+    @property
+    def col(self) -> int:
+        return self.pos - self.line_pos + 1
+
+    @property
+    def char(self) -> str:
+        return self.src[self.pos]
+
     def push_token(
         self,
+        pos: int,
         kind: TokenKind,
         instance: str | None = None,
-        multi_line_start: int | None = None,
     ) -> None:
-        if multi_line_start is None:
-            line_start = self.line_start
-        else:
-            line_start = multi_line_start
-        token = Token(line_start, self.col_start, kind, instance)
+        token = Token(self.line, pos - self.line_pos + 1, kind, instance)
         self.tokens.append(token)
 
-    def eat(self) -> None:
-        self.pos += 1
-        self.col += 1
-        if self.char == '\n':
-            self.line += 1
-            self.col = 1
-            self.line_start = self.line
-            self.col_start = self.col
-        if self.pos < len(self.src):
-            self.char = self.src[self.pos]
-        else:
-            self.char = EOF
-
-    def peek(self, ahead: int = 1) -> str | None:
-        if self.pos + ahead < len(self.src):
-            return self.src[self.pos + ahead]
-        else:
-            return None
-
-    def eat_expecting(self, expectation: str) -> None:
-        fail_msg = f'{self.char} != {expectation} at line: {self.line}, col: {self.col}'
-        assert self.char == expectation, fail_msg
-        self.eat()
+    def advance_over(self, pos: int, text: str) -> int:
+        num_newlines = text.count('\n')
+        if num_newlines:
+            self.line += num_newlines
+            self.line_pos = pos + text.rfind('\n') + 1
+        return pos + len(text)
 
     def syntax_error_on_char(self) -> NoReturn:
         raise SyntaxError(
@@ -174,321 +213,265 @@ class Lexer:
         )
 
     def lex(self) -> list[Token]:
-        while self.pos < len(self.src):
-            self.line_start = self.line
-            self.col_start = self.col
-            match self.char:
-                case '\n':
-                    self.eat()
-                    self.lex_indentation()
-                case ' ':
-                    self.eat()
-                case '=':
-                    match self.peek():
-                        case '=':
-                            self.push_token('==')
-                            self.eat_expecting('=')
-                            self.eat_expecting('=')
-                        case _:
-                            self.push_token(self.char)
-                            self.eat()
-                case '%':
-                    match self.peek():
-                        case '=':
-                            self.push_token('%=')
-                            self.eat_expecting('%')
-                            self.eat_expecting('=')
-                        case _:
-                            self.push_token(self.char)
-                            self.eat()
-                case '+':
-                    match self.peek():
-                        case '=':
-                            self.push_token('+=')
-                            self.eat_expecting('+')
-                            self.eat_expecting('=')
-                        case _:
-                            self.push_token(self.char)
-                            self.eat()
-                case '*':
-                    match self.peek():
-                        case '*':
-                            self.push_token('**')
-                            self.eat_expecting('*')
-                            self.eat_expecting('*')
-                        case '=':
-                            self.push_token('*=')
-                            self.eat_expecting('*')
-                            self.eat_expecting('=')
-                        case _:
-                            self.push_token(self.char)
-                            self.eat()
-                case '/':
-                    match self.peek():
-                        case '/':
-                            self.push_token('//')
-                            self.eat_expecting('/')
-                            self.eat_expecting('/')
-                        case '=':
-                            self.push_token('/=')
-                            self.eat_expecting('/')
-                            self.eat_expecting('=')
-                        case _:
-                            self.push_token(self.char)
-                            self.eat()
-                case '-':
-                    match self.peek():
-                        case '=':
-                            self.push_token('-=')
-                            self.eat_expecting('-')
-                            self.eat_expecting('=')
-                        case '>':
-                            self.push_token('->')
-                            self.eat()
-                            self.eat_expecting('>')
-                        case _:
-                            self.push_token(self.char)
-                            self.eat()
-                case '>':
-                    match self.peek():
-                        case '=':
-                            self.push_token('>=')
-                            self.eat_expecting('>')
-                            self.eat_expecting('=')
-                        case _:
-                            self.push_token(self.char)
-                            self.eat()
-                case '<':
-                    match self.peek():
-                        case '=':
-                            self.push_token('<=')
-                            self.eat_expecting('<')
-                            self.eat_expecting('=')
-                        case _:
-                            self.push_token(self.char)
-                            self.eat()
-                case ':':
-                    match self.peek():
-                        case '=':
-                            self.push_token(':=')
-                            self.eat_expecting(':')
-                            self.eat_expecting('=')
-                        case _:
-                            self.push_token(self.char)
-                            self.eat()
-                case '!':
-                    match self.peek():
-                        case '=':
-                            self.push_token('!=')
-                            self.eat_expecting('!')
-                            self.eat_expecting('=')
-                        case _:
-                            self.syntax_error_on_char()
-                case '|' | '{' | '}' | '[' | ']' | '(' | ')' | '.' | ',':
-                    self.push_token(self.char)
-                    self.eat()
-                case "'" | '"':
-                    if (self.peek(ahead=1), self.peek(ahead=2)) == (self.char, self.char):
-                        self.lex_quote_comment(start_char=self.char)
-                    else:
-                        self.lex_string(start_char=self.char)
-                case s if s.isalpha() or s.isnumeric() or s == '_':
-                    self.lex_name_or_keyword()
-                case i if i.isnumeric():
-                    self.lex_number()
-                case '#':
-                    self.lex_hash_comment()
-                case _:
-                    self.syntax_error_on_char()
+        # NOTE: One byte per char, with non-ascii chars replaced by '?' which dispatches to
+        # lex_name_or_error, so indexing gives the char code without an ord() call.
+        codes = self.src.encode('ascii', errors='replace')
+        n = len(codes)
+        dispatch = LEXER_DISPATCH
+        # NOTE: Every handler pushes its token before advancing, so the token gets the
+        # position of its first char without recording a start position per token.
+        # Handlers take pos and return the new one, so the loop keeps it in a local and
+        # self.pos is only written here and before raising.
+        pos = self.pos
+        while pos < n:
+            pos = dispatch[codes[pos]](self, pos)
+        self.pos = pos
         return self.tokens
 
-    def lex_string(self, start_char: Literal["'", '"']) -> None:
-        chars: list[str] = []
-        self.eat()
-        while self.char != start_char:
-            chars.append(self.char)
-            self.eat()
-        instance = ''.join(chars)
-        self.push_token('instance_string', f'{start_char}{instance}{start_char}')
-        self.eat_expecting(start_char)
-
-    def lex_name_or_keyword(self) -> None:
-        chars: list[str] = []
-        while self.pos < len(self.src) and (
-            self.char.isalpha() or self.char.isnumeric() or self.char == '_'
-        ):
-            chars.append(self.char)
-            self.eat()
-        instance = ''.join(chars)
+    def lex_newline(self, pos: int) -> int:
+        self.line += 1
+        self.line_pos = pos + 1
+        return self.lex_indentation(pos + 1)
+
+    def lex_space(self, pos: int) -> int:
+        match = SPACES_RE.match(self.src, pos)
+        assert match is not None
+        return match.end()
+
+    def lex_punctuation(self, pos: int) -> int:
+        # NOTE: Runs for a large share of tokens, so build the token in place.
+        kind = ONE_CHAR_TOKENS[self.src[pos]]
+        self.tokens.append(Token(self.line, pos - self.line_pos + 1, kind))
+        return pos + 1
+
+    def lex_operator(self, pos: int) -> int:
+        src = self.src
+        two_char_kind = TWO_CHAR_TOKENS.get(src[pos:pos + 2])
+        if two_char_kind is not None:
+            self.push_token(pos, two_char_kind)
+            return pos + 2
+        one_char_kind = ONE_CHAR_TOKENS.get(src[pos])
+        if one_char_kind is None:
+            self.pos = pos
+            self.syntax_error_on_char()
+        self.push_token(pos, one_char_kind)
+        return pos + 1
+
+    def lex_quote(self, pos: int) -> int:
+        start_char: Literal["'", '"'] = "'" if self.src[pos] == "'" else '"'
+        if self.src.startswith(start_char * 3, pos):
+            return self.lex_quote_comment(pos, start_char=start_char)
+        else:
+            return self.lex_string(pos, start_char=start_char)
+
+    def lex_name_or_error(self, pos: int) -> int:
+        char = self.src[pos]
+        if char.isalpha() or char.isnumeric() or char == '_':
+            return self.lex_name_or_keyword(pos)
+        self.pos = pos
+        self.syntax_error_on_char()
+
+    def lex_string(self, pos: int, start_char: Literal["'", '"']) -> int:
+        end = self.src.find(start_char, pos + 1)
+        if end == -1:
+            self.pos = pos
+            raise SyntaxError(
+                f'Unterminated string starting on line {self.line} in col {self.col}.'
+            )
+        instance = self.src[pos:end + 1]
+        self.push_token(pos, 'instance_string', instance)
+        return self.advance_over(pos, instance)
+
+    def lex_name_or_keyword(self, pos: int) -> int:
+        match = NAME_RE.match(self.src, pos)
+        assert match is not None
+        # NOTE: The same few names repeat all over a source, so share one string per name.
+        instance = sys.intern(match.group())
         kind: Literal['instance_keyword', 'instance_name']
         if instance in KEYWORDS:
             kind = 'instance_keyword'
         else:
             kind = 'instance_name'
-        self.push_token(kind, instance)
-
-    def lex_number(self) -> None:
-        chars: list[str] = []
-        while self.pos < len(self.src) and (self.char.isnumeric() or self.char == '.'):
-            chars.append(self.char)
-            self.eat()
-        instance = ''.join(chars)
-        self.push_token('instance_number', instance)
-
-    def lex_quote_comment(self, start_char: Literal["'", '"']) -> None:
-        multi_line_start = self.line_start
-        chars: list[str] = [start_char]
-        for _ in range(3):
-            chars.append(self.char)
-            self.eat_expecting(start_char)
-        while self.pos < len(self.src):
-            if self.char != start_char:
-                chars.append(self.char)
-                self.eat()
-            elif (self.peek(ahead=1), self.peek(ahead=2)) == (start_char, start_char):
-                for _ in range(3):
-                    chars.append(start_char)
-                    self.eat_expecting(start_char)
-                instance = ''.join(chars)
-                self.push_token('instance_quote_string', instance, multi_line_start)
-                break
-            else:
-                chars.append(self.char)
-                self.eat()
-
-    def lex_hash_comment(self) -> None:
-        self.eat_expecting('#')
-        chars: list[str] = []
-        while self.pos < len(self.src) and self.char != '\n':
-            chars.append(self.char)
-            self.eat()
-        instance = ''.join(chars)
-        self.push_token('instance_hash_comment', instance)
-
-    def lex_indentation(self) -> None:
+        self.push_token(pos, kind, instance)
+        return pos + len(instance)
+
+    def lex_quote_comment(self, pos: int, start_char: Literal["'", '"']) -> int:
+        end = self.src.find(start_char * 3, pos + 3)
+        if end == -1:
+            self.pos = pos
+            raise SyntaxError(
+                f'Unterminated string starting on line {self.line} in col {self.col}.'
+            )
+        instance = self.src[pos:end + 3]
+        self.push_token(pos, 'instance_quote_comment', instance)
+        return self.advance_over(pos, instance)
+
+    def lex_hash_comment(self, pos: int) -> int:
+        src = self.src
+        end = src.find('\n', pos)
+        if end == -1:
+            end = len(src)
+        instance = src[pos + 1:end]
+        self.push_token(pos, 'instance_hash_comment', instance)
+        return end
+
+    def lex_indentation(self, pos: int) -> int:
         # NOTE: We assume 4 for now :)
-        num_spaces = 0
-        while self.char == ' ':
-            num_spaces += 1
-            self.eat()
+        match = INDENT_RE.match(self.src, pos)
+        assert match is not None
+        num_spaces = match.end() - pos
         if num_spaces % 4 != 0:
             raise SyntaxError(
                 f'Unexpected indent on line {self.line}.'
             )
         num_indents = num_spaces // 4
-        for _ in range(num_indents):
-            self.push_token('instance_indent')
-
-
-def print_tokens(tokens: list[Token]) -> None:
-    total_lines = max(token.line for token in tokens)
-    line = 1
-    while line <= total_lines:
-        tokens_on_line = [token for token in tokens if token.line == line]
-        space_separated_tokens = ' '.join(repr(token) for token in tokens_on_line)
-        print(space_separated_tokens)
-        line += 1
+        if num_indents:
+            # NOTE: Indents on a line share line and col, so one token can stand for all of them.
+            col = pos - self.line_pos + 1
+            self.tokens.extend([Token(self.line, col, 'instance_indent')] * num_indents)
+        return pos + num_spaces
+
+
+def build_lexer_dispatch() -> list[Callable[[Lexer, int], int]]:
+    dispatch: list[Callable[[Lexer, int], int]] = [Lexer.lex_name_or_error] * 128
+    for char in ASCII_NAME_CHARS:
+        dispatch[ord(char)] = Lexer.lex_name_or_keyword
+    dispatch[ord('\n')] = Lexer.lex_newline
+    dispatch[ord(' ')] = Lexer.lex_space
+    for char in '=%+*/-><:!':
+        dispatch[ord(char)] = Lexer.lex_operator
+    for char in '|{}[]().,@':
+        dispatch[ord(char)] = Lexer.lex_punctuation
+    dispatch[ord("'")] = Lexer.lex_quote
+    dispatch[ord('"')] = Lexer.lex_quote
+    dispatch[ord('#')] = Lexer.lex_hash_comment
+    return dispatch
+
+
+LEXER_DISPATCH: Final = build_lexer_dispatch()
+
+
+def lex_file(path: str) -> list[Token]:
+    with open(path, 'r') as fp:
+        src = fp.read()
+    return Lexer(src).lex()
 
 
-class GrowingLineBuffer:
-    def __init__(self) -> None:
-        self._data: list[list[str]] = []
+def lex_files(paths: list[str]) -> list[list[Token]]:
+    if len(paths) <= 1:
+        return [lex_file(path) for path in paths]
+    # NOTE: Imported here so that `import python` and main() don't pay for the pool machinery.
+    from concurrent.futures import ProcessPoolExecutor
+    # NOTE: Files are lexed independently, so spread them over processes to sidestep the GIL.
+    with ProcessPoolExecutor() as executor:
+        return list(executor.map(lex_file, paths))
 
-    def insert(self, line: int, col: int, chars: str) -> None:
-        while len(self._data) <= line:
-            self._data.append([])
-        while len(self._data[line - 1]) < col - 1 + len(chars):
-            self._data[line - 1].append(' ')
-        for i, char in enumerate(chars):
-            self._data[line - 1][col - 1 + i] = char
 
-    def __str__(self) -> str:
-        return '\n'.join(''.join(char for char in line) for line in self._data)
+def print_tokens(tokens: list[Token]) -> None:
+    # NOTE: The lexer emits tokens in line order, so each line is one consecutive group.
+    prev_line = 0
+    for line, tokens_on_line in groupby(tokens, key=attrgetter('line')):
+        if line - prev_line > 1:
+            print('\n' * (line - prev_line - 1), end='')
+        space_separated_tokens = ' '.join(map(repr, tokens_on_line))
+        print(space_separated_tokens)
+        prev_line = line
 
 
 def tokens_to_src(tokens: list[Token]) -> str:
-    buff = GrowingLineBuffer()
+    parts: list[str] = []
+    line = 1
+    col = 1
     for token in tokens:
-        match (token.kind, token.instance):
-            case ('instance_hash_comment', _):
-                assert token.instance is not None
-                content = '#' + token.instance
-            case ('instance_indent', _):
-                content = '    '
-            case (_, None):
-                content = token.kind
-            case (_, _):
-                assert token.instance is not None
-                content = token.instance
-        buff.insert(token.line, token.col, content)
-    return str(buff)
+        instance = token.instance
+        content: str
+        if instance is None:
+            content = '    ' if token.kind == 'instance_indent' else token.kind
+        elif token.kind == 'instance_hash_comment':
+            content = '#' + instance
+        else:
+            content = instance
+        if token.line > line:
+            parts.append('\n' * (token.line - line))
+            line = token.line
+            col = 1
+        if token.col < col:
+            # NOTE: All indents on a line sit at col 1, so only write what lands past the cursor.
+            content = content[col - token.col:]
+        elif token.col > col:
+            parts.append(' ' * (token.col - col))
+            col = token.col
+        parts.append(content)
+        num_newlines = content.count('\n')
+        if num_newlines == 0:
+            col += len(content)
+        else:
+            line += num_newlines
+            col = len(content) - content.rfind('\n')
+    if tokens:
+        parts.append('\n')
+    return ''.join(parts)
 
 
 ExprContext = Literal['load', 'store', 'del']
 
 
+@dataclass(slots=True)
 class Module:
-    def __init__(self, body: list[Stmt]) -> None:
-        self.body = body
+    body: list[Stmt]
 
 
+@dataclass(slots=True)
 class FunArg:
-    def __init__(self, name: str, default: Expr, annotated: bool, type_expr: Expr) -> None:
-        self.name = name
-        self.default = default
-        self.annotated = annotated
-        self.type_expr = type_expr
+    name: str
+    default: Expr
+    annotated: bool
+    type_expr: Expr
 
 
+@dataclass(slots=True)
 class FunDef:
-    def __init__(
-        self,
-        name: str,
-        args: list[FunArg],
-        body: list[Stmt],
-        return_type: Expr | None,
-    ) -> None:
-        self.name = name
-        self.args = args
-        self.body = body
-        self.return_type = return_type
+    name: str
+    args: list[FunArg]
+    body: list[Stmt]
+    return_type: Expr | None
 
 
+@dataclass(slots=True)
 class ClassDef:
-    def __init__(self, name: str, body: list[Stmt]) -> None:
-        self.name = name
-        self.body = body
+    name: str
+    body: list[Stmt]
 
 
+@dataclass(slots=True)
 class Return:
-    def __init__(self, value: Expr | None) -> None:
-        self.value = value
+    value: Expr | None
 
 
+@dataclass(slots=True)
 class Assign:
-    def __init__(self, target: Expr, value: Expr, assign_type: Expr | None) -> None:
-        self.target = target
-        self.value = value
-        self.assign_type = assign_type
+    target: Expr
+    value: Expr
+    assign_type: Expr | None
 
 
+@dataclass(slots=True)
 class For:
-    def __init__(self, target: Expr, iter_expr: Expr, body: list[Stmt]) -> None:
-        self.target = target
-        self.iter_expr = iter_expr
-        self.body = body
+    target: Expr
+    iter_expr: Expr
+    body: list[Stmt]
 
 
+@dataclass(slots=True)
 class While:
-    def __init__(self, test: Expr, body: list[Stmt]) -> None:
-        self.test = test
-        self.body = body
+    test: Expr
+    body: list[Stmt]
 
 
+@dataclass(slots=True)
 class If:
-    def __init__(self, test: Expr, body: list[Stmt]) -> None:
-        self.test = test
-        self.body = body
+    test: Expr
+    body: list[Stmt]
 
 
 class With:
@@ -539,24 +522,24 @@ UnaryOpOp = Literal['+', '-', 'not']
 CompOpOp = Literal['==', '!=', '<', '<=', '>', '>=', 'is', 'is not', 'in', 'not in']
 
 
+@dataclass(slots=True)
 class BoolOp:
-    def __init__(self, left: Expr, op: BoolOpOp, right: Expr) -> None:
-        self.left = left
-        self.op = op
-        self.right = right
+    left: Expr
+    op: BoolOpOp
+    right: Expr
 
 
+@dataclass(slots=True)
 class BinOp:
-    def __init__(self, left: Expr, op: BinOpOp, right: Expr) -> None:
-        self.left = left
-        self.op = op
-        self.right = right
+    left: Expr
+    op: BinOpOp
+    right: Expr
 
 
+@dataclass(slots=True)
 class UnaryOp:
-    def __init__(self, op: UnaryOpOp, operand: Expr) -> None:
-        self.op = op
-        self.operand = operand
+    op: UnaryOpOp
+    operand: Expr
 
 
 class IfExp:
@@ -589,24 +572,24 @@ class DictComp:
     ...
 
 
+@dataclass(slots=True)
 class CompOp:
-    def __init__(self, left: Expr, op: CompOpOp, right: Expr) -> None:
-        self.left = left
-        self.op = op
-        self.right = right
+    left: Expr
+    op: CompOpOp
+    right: Expr
 
 
+@dataclass(slots=True)
 class KeyWord:
-    def __init__(self, name: str, value: Expr) -> None:
-        self.name = name
-        self.value = value
+    name: str
+    value: Expr
 
 
+@dataclass(slots=True)
 class Call:
-    def __init__(self, func: Name, args: list[Expr], keywords: list[KeyWord]) -> None:
-        self.func = func
-        self.args = args
-        self.keywords = keywords
+    func: Name
+    args: list[Expr]
+    keywords: list[KeyWord]
 
 
 class FormattedValue:
@@ -619,17 +602,17 @@ class JoinedStr:
     ...
 
 
+@dataclass(slots=True)
 class Attribute:
-    def __init__(self, value: Expr, attr: str, ctx: ExprContext) -> None:
-        self.value = value
-        self.attr = attr
-        self.ctx = ctx
+    value: Expr
+    attr: str
+    ctx: ExprContext
 
 
+@dataclass(slots=True)
 class Name:
-    def __init__(self, lit: str, ctx: ExprContext) -> None:
-        self.lit = lit
-        self.ctx = ctx
+    lit: str
+    ctx: ExprContext
 
 
 class List:
@@ -647,20 +630,20 @@ class Slice:
     ...
 
 
+@dataclass(slots=True)
 class Int:
-    def __init__(self, lit: int) -> None:
-        self.lit = lit
+    lit: int
 
 
+@dataclass(slots=True)
 class Float:
-    def __init__(self, lit: float) -> None:
-        self.lit = lit
+    lit: float
 
 
+@dataclass(slots=True)
 class Str:
-    def __init__(self, lit: str, quote_style: Literal['"', "'"]) -> None:
-        self.lit = lit
-        self.quote_style = quote_style
+    lit: str
+    quote_style: Literal['"', "'"]
 
 
 Constant: TypeAlias = Union[Int, Float, Str]
@@ -3,6 +3,7 @@ from textwrap import dedent
 import pytest
 
 from python import Lexer
+from python import lex_files
 from python import print_tokens
 from python import tokens_to_src
 
@@ -66,3 +67,87 @@ def test_src_to_tokens_to_src():
     tokens = lexer.lex()
     generated_src_from_tokens = tokens_to_src(tokens)
     assert generated_src_from_tokens == src
+
+
+def test_lex_files_matches_lexing_each_file():
+    paths = ['python.py', 't.py']
+    expected = []
+    for path in paths:
+        with open(path, 'r') as fp:
+            expected.append(Lexer(fp.read()).lex())
+    results = lex_files(paths)
+
+    def fields(tokens):
+        return [(token.line, token.col, token.kind, token.instance) for token in tokens]
+
+    assert [fields(tokens) for tokens in results] == [fields(tokens) for tokens in expected]
+
+
+def test_lex_files_single_file():
+    with open('t.py', 'r') as fp:
+        expected = Lexer(fp.read()).lex()
+    [tokens] = lex_files(['t.py'])
+    assert list(map(repr, tokens)) == list(map(repr, expected))
+
+
+def test_lex_unterminated_string():
+    with pytest.raises(SyntaxError, match='Unterminated string starting on line 2 in col 5'):
+        Lexer("x = 1\ny = 'abc\n").lex()
+
+
+def test_lex_multi_line_string_position():
+    tokens = Lexer("x = 'a\nb'\ny\n").lex()
+    string_token = tokens[2]
+    assert (string_token.line, string_token.col) == (1, 5)
+    assert repr(string_token) == "string('a\nb')"
+    assert tokens[3].line == 3
+
+
+def test_lex_quote_comment():
+    src = dedent('''\
+        def main():
+            """Says hello.
+
+            Twice.
+            """
+        ''')
+    tokens = Lexer(src).lex()
+    comment_token = tokens[6]
+    assert (comment_token.line, comment_token.col) == (2, 5)
+    assert repr(comment_token) == 'quote_comment("""Says hello.\n\n    Twice.\n    """)'
+    assert tokens_to_src(tokens) == src
+
+
+def test_lex_unterminated_quote_comment():
+    with pytest.raises(SyntaxError, match='Unterminated string starting on line 1 in col 1'):
+        Lexer("'''abc\n").lex()
+
+
+def test_lex_unicode_name():
+    tokens = Lexer('é = 1\n').lex()
+    assert repr(tokens[0]) == 'name(é)'
+    assert tokens[0].col == 1
+    assert repr(tokens[1]) == '='
+    assert tokens[1].col == 3
+
+
+@pytest.mark.parametrize('src,expected_message', [
+    ('a ? b', 'Unexpected char ? on line 1 in col 3.'),
+    ('x = 😀', 'Unexpected char 😀 on line 1 in col 5.'),
+    ('!x', 'Unexpected char ! on line 1 in col 1.'),
+])
+def test_lex_unexpected_char(src, expected_message):
+    with pytest.raises(SyntaxError) as excinfo:
+        Lexer(src).lex()
+    assert str(excinfo.value) == expected_message
+
+
+def test_lex_decorator(capsys):
+    print_tokens(Lexer('@x\n').lex())
+    captured = capsys.readouterr()
+    assert captured.out == '@ name(x)\n'
+
+
+def test_print_tokens_empty(capsys):
+    print_tokens([])
+    assert capsys.readouterr().out == ''